@@ -0,0 +1,15 @@
+@echo off
+rem 使用Nuitka构建AOT编译的单文件版本
+rem 相比PyInstaller（解包+解释器冷启动），编译产物的启动延迟明显更低
+call .venv\Scripts\activate
+
+python -m pip install nuitka
+
+python -m nuitka ^
+    --standalone ^
+    --onefile ^
+    --enable-plugin=pyside6 ^
+    --windows-console-mode=disable ^
+    --windows-icon-from-ico=assets\st.ico ^
+    --include-data-dir=assets=assets ^
+    main.py
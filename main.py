@@ -6,22 +6,30 @@ Windows表情包管理器
 import sys
 import os
 import json
+import bisect
+import hashlib
 import logging
-import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from collections import OrderedDict
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QScrollArea, QPushButton, QLineEdit, QLabel, QSystemTrayIcon,
-    QMenu, QFileDialog, QMessageBox, QGridLayout, QFrame
+    QScrollArea, QPushButton, QLineEdit, QSystemTrayIcon,
+    QMenu, QListView
+)
+from PySide6.QtCore import (
+    Qt, QSize, QTimer, Signal, QObject, QUrl, QMimeData,
+    QRunnable, QThreadPool, QAbstractListModel, QModelIndex, QByteArray,
 )
-from PySide6.QtCore import Qt, QSize, QTimer, Signal, QThread, QObject, QUrl, QMimeData
 from PySide6.QtGui import (
     QPixmap,
+    QPixmapCache,
     QImage,
+    QImageReader,
     QIcon,
     QPainter,
     QColor,
@@ -30,8 +38,11 @@ from PySide6.QtGui import (
     QKeySequence,
     QShortcut,
 )
-from PIL import Image
-import keyboard
+# orjson（C扩展）比标准库json快数倍，未安装时退回标准库
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # ==================== 资源路径处理 ====================
@@ -66,6 +77,12 @@ logging.info(f"图标路径: {program_icon}")
 
 
 # ==================== 配置管理器 ====================
+@lru_cache(maxsize=128)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """缓存点号配置键的拆分结果，避免每次访问都split"""
+    return tuple(key.split('.'))
+
+
 class ConfigManager:
     """JSON配置文件管理"""
 
@@ -78,8 +95,10 @@ class ConfigManager:
         """加载配置文件"""
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                data = self.config_file.read_bytes()
+                if orjson is not None:
+                    return orjson.loads(data)
+                return json.loads(data)
             except Exception as e:
                 logging.error(f"配置文件加载失败: {e}")
 
@@ -110,15 +129,23 @@ class ConfigManager:
         """保存配置文件"""
         self.config_dir.mkdir(parents=True, exist_ok=True)
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                payload = orjson.dumps(
+                    self.config,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            else:
+                payload = json.dumps(
+                    self.config, indent=2, ensure_ascii=False
+                ).encode('utf-8')
+            self.config_file.write_bytes(payload)
             logging.info("配置已保存")
         except Exception as e:
             logging.error(f"配置保存失败: {e}")
 
     def get(self, key: str, default=None):
         """获取配置项"""
-        keys = key.split('.')
+        keys = _split_key(key)
         value = self.config
         for k in keys:
             if isinstance(value, dict):
@@ -129,7 +156,7 @@ class ConfigManager:
 
     def set(self, key: str, value):
         """设置配置项"""
-        keys = key.split('.')
+        keys = _split_key(key)
         config = self.config
         for k in keys[:-1]:
             if k not in config:
@@ -160,12 +187,16 @@ def setup_logging():
 class StickerLibrary:
     """表情库数据管理"""
 
-    SUPPORTED_FORMATS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'}
+    # 不带点的小写扩展名，配合rpartition('.')判断，避开Path.suffix属性开销
+    SUPPORTED_EXTS = {'jpg', 'jpeg', 'png', 'gif', 'bmp', 'webp'}
 
     def __init__(self, library_path: str):
         self.library_path = Path(library_path)
         self.categories: Dict[str, List[Path]] = {}
         self.all_stickers: List[Path] = []
+        # 搜索索引：加载时统一算好小写文件名，搜索热路径不再触碰Path属性
+        self._lower_index: List[Tuple[str, Path]] = []
+        self._sorted_lower: List[Tuple[str, Path]] = []
 
     def load_library(self):
         """扫描并加载表情库结构"""
@@ -178,129 +209,186 @@ class StickerLibrary:
 
         logging.info(f"开始扫描表情库: {self.library_path}")
 
-        # 遍历子目录作为分类
-        for category_dir in self.library_path.iterdir():
-            if not category_dir.is_dir():
-                continue
-
-            category_name = category_dir.name
-            stickers = []
+        # 遍历子目录作为分类（DirEntry自带类型信息，省掉逐条stat）
+        with os.scandir(self.library_path) as it:
+            category_dirs = [
+                entry for entry in it if entry.is_dir(follow_symlinks=False)
+            ]
 
-            # 扫描该分类下的所有图片文件
-            for file_path in category_dir.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in self.SUPPORTED_FORMATS:
-                    stickers.append(file_path)
-                    self.all_stickers.append(file_path)
+        # 目录I/O会释放GIL，按分类并行扫描；结果在主线程统一汇总，无需加锁
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(self._scan_category, category_dirs))
 
+        for category_name, stickers in results:
             if stickers:
-                self.categories[category_name] = sorted(stickers, key=lambda x: x.name)
+                self.categories[category_name] = stickers
+                self.all_stickers.extend(stickers)
                 logging.info(f"分类 [{category_name}] 加载 {len(stickers)} 个表情")
 
+        # 重建搜索索引
+        self._lower_index = [(p.stem.lower(), p) for p in self.all_stickers]
+        self._sorted_lower = sorted(self._lower_index)
+
         logging.info(f"表情库加载完成，共 {len(self.categories)} 个分类，{len(self.all_stickers)} 个表情")
 
+    def _scan_category(self, category_dir: os.DirEntry) -> Tuple[str, List[Path]]:
+        """扫描单个分类目录下的图片文件（在线程池中运行）"""
+        stickers = []
+        with os.scandir(category_dir.path) as it:
+            for entry in it:
+                # 预览图在扫描阶段就过滤掉，显示热路径无需再判断
+                if entry.name.startswith('.preview'):
+                    continue
+                if (entry.is_file(follow_symlinks=False)
+                        and entry.name.rpartition('.')[2].lower() in self.SUPPORTED_EXTS):
+                    stickers.append(Path(entry.path))
+
+        return category_dir.name, sorted(stickers, key=lambda x: x.name)
+
     def search_stickers(self, keyword: str) -> List[Path]:
-        """搜索表情（按文件名）"""
+        """搜索表情（按文件名）
+
+        两字符以上的关键词按前缀在有序索引上二分，复杂度只与命中数相关；
+        短关键词或带 * 通配的关键词退回子串匹配（同样走预建索引）。
+        """
         if not keyword:
             return []
 
         keyword = keyword.lower()
-        results = []
 
-        for sticker in self.all_stickers:
-            if keyword in sticker.stem.lower():
-                results.append(sticker)
+        if len(keyword) >= 2 and '*' not in keyword:
+            # 前缀区间 [keyword, keyword+U+10FFFF] 上二分查找；
+            # 上界必须取最大码点，否则前缀后紧跟emoji等增补平面字符的文件名会被漏掉
+            lo = bisect.bisect_left(self._sorted_lower, (keyword,))
+            hi = bisect.bisect_right(self._sorted_lower, (keyword + chr(0x10FFFF),))
+            return [path for _, path in self._sorted_lower[lo:hi]]
+
+        keyword = keyword.replace('*', '')
+        return [path for stem, path in self._lower_index if keyword in stem]
+
+
+# ==================== 异步缩略图加载 ====================
+# 持久化缩略图目录（freedesktop风格：按尺寸分目录，文件名为原图路径的md5）
+THUMBS_DIR = Path.home() / ".sticker_manager" / "thumbs"
 
-        return results
 
+class ThumbTaskSignals(QObject):
+    """缩略图任务信号载体（QRunnable本身不能发射信号）"""
 
-# ==================== 图像缓存管理器 ====================
-class ThumbnailCache:
-    """LRU缩略图缓存"""
+    done = Signal(str, int, QImage)  # (图片路径, 目标尺寸, 解码结果)
 
-    def __init__(self, max_size: int = 200):
-        self.cache: OrderedDict[str, QPixmap] = OrderedDict()
+
+class ThumbTask(QRunnable):
+    """后台缩略图解码任务"""
+
+    def __init__(self, image_path: Path, max_size: int):
+        super().__init__()
+        self.image_path = image_path
         self.max_size = max_size
+        self.signals = ThumbTaskSignals()
 
-    def get(self, key: str) -> Optional[QPixmap]:
-        """获取缓存的缩略图"""
-        if key in self.cache:
-            # 移到最后（最近使用）
-            self.cache.move_to_end(key)
-            return self.cache[key]
-        return None
+    def run(self):
+        """在工作线程中解码并缩放（QImage线程安全，QPixmap只能在GUI线程构造）"""
+        thumb_path = self.thumb_cache_path()
 
-    def put(self, key: str, pixmap: QPixmap):
-        """添加缩略图到缓存"""
-        if key in self.cache:
-            self.cache.move_to_end(key)
-        else:
-            self.cache[key] = pixmap
-            # 超出容量则删除最旧的
-            if len(self.cache) > self.max_size:
-                self.cache.popitem(last=False)
+        # 磁盘缓存未过期则直接读小图，跳过原图解码
+        try:
+            if (thumb_path.exists()
+                    and os.path.getmtime(thumb_path) >= os.path.getmtime(self.image_path)):
+                image = QImage(str(thumb_path))
+                if not image.isNull():
+                    self.signals.done.emit(
+                        str(self.image_path), self.max_size, image
+                    )
+                    return
+        except OSError:
+            pass
 
-    def clear(self):
-        """清空缓存"""
-        self.cache.clear()
+        reader = QImageReader(str(self.image_path))
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid():
+            size.scale(self.max_size, self.max_size, Qt.KeepAspectRatio)
+            reader.setScaledSize(size)
+        image = reader.read()
+
+        # 写入磁盘缓存（在工作线程完成，不占用GUI线程）
+        if not image.isNull():
+            try:
+                thumb_path.parent.mkdir(parents=True, exist_ok=True)
+                image.save(str(thumb_path), "PNG")
+            except OSError as e:
+                logging.warning(f"缩略图写盘失败 {thumb_path}: {e}")
+
+        self.signals.done.emit(str(self.image_path), self.max_size, image)
+
+    def thumb_cache_path(self) -> Path:
+        """磁盘缓存路径：thumbs/<尺寸>/<md5(原图路径)>.png"""
+        digest = hashlib.md5(str(self.image_path).encode('utf-8')).hexdigest()
+        return THUMBS_DIR / str(self.max_size) / f"{digest}.png"
 
 
 # ==================== UI组件 ====================
-class StickerCell(QFrame):
-    """表情单元格组件"""
+class StickerModel(QAbstractListModel):
+    """表情网格的列表模型
 
-    clicked = Signal(Path)
-    double_clicked = Signal(Path)
+    配合IconMode的QListView实现虚拟化：视图只为可见项请求数据，
+    缩略图在首次被请求时经由provider异步加载，加载完成后按行刷新。
+    """
 
-    def __init__(self, sticker_path: Path, cell_size: int, parent=None):
+    def __init__(self, thumbnail_provider, parent=None):
         super().__init__(parent)
-        self.sticker_path = sticker_path
-        self.cell_size = cell_size
-        self.is_highlighted = False
-
-        self.setFixedSize(cell_size, cell_size)
-        self.setFrameShape(QFrame.Box)
-        self.setStyleSheet("QFrame { background-color: #f5f5f5; border: 2px solid #e0e0e0; }")
+        self._stickers: List[Path] = []
+        self._row_by_path: Dict[str, int] = {}
+        self._thumbnail_provider = thumbnail_provider
+
+    def set_stickers(self, stickers: List[Path]):
+        """整体替换当前显示的表情列表"""
+        self.beginResetModel()
+        self._stickers = list(stickers)
+        self._row_by_path = {str(p): i for i, p in enumerate(self._stickers)}
+        self.endResetModel()
+
+    def sticker_at(self, index: QModelIndex) -> Optional[Path]:
+        """取索引对应的表情路径"""
+        if index.isValid() and 0 <= index.row() < len(self._stickers):
+            return self._stickers[index.row()]
+        return None
 
-        # 图片标签
-        self.image_label = QLabel(self)
-        self.image_label.setAlignment(Qt.AlignCenter)
-        self.image_label.setScaledContents(False)
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._stickers)
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.addWidget(self.image_label)
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        sticker_path = self.sticker_at(index)
+        if sticker_path is None:
+            return None
 
-    def set_thumbnail(self, pixmap: QPixmap):
-        """设置缩略图"""
-        if pixmap:
-            # 等比例缩放
-            scaled_pixmap = pixmap.scaled(
-                self.cell_size - 10,
-                self.cell_size - 10,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            self.image_label.setPixmap(scaled_pixmap)
+        if role == Qt.DecorationRole:
+            # 缓存未命中时provider返回None并调度异步加载，加载完成后dataChanged刷新
+            pixmap = self._thumbnail_provider(sticker_path)
+            if pixmap is not None:
+                return QIcon(pixmap)
+            return None
 
-    def mousePressEvent(self, event):
-        """单击高亮"""
-        self.is_highlighted = True
-        self.setStyleSheet("QFrame { background-color: #e3f2fd; border: 2px solid #2196f3; }")
-        self.clicked.emit(self.sticker_path)
+        if role == Qt.ToolTipRole:
+            return sticker_path.name
 
-    def mouseDoubleClickEvent(self, event):
-        """双击复制"""
-        self.double_clicked.emit(self.sticker_path)
+        return None
 
-    def clear_highlight(self):
-        """清除高亮"""
-        self.is_highlighted = False
-        self.setStyleSheet("QFrame { background-color: #f5f5f5; border: 2px solid #e0e0e0; }")
+    def refresh_sticker(self, sticker_path: Path):
+        """缩略图异步加载完成，通知视图重绘对应行"""
+        row = self._row_by_path.get(str(sticker_path))
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
 
 
 class CategoryButton(QPushButton):
     """分类按钮组件"""
 
+    # 应用级图标缓存：重建分类面板（如重新加载）时跳过缩放和QIcon构造
+    _icon_cache: Dict[str, QIcon] = {}
+
     def __init__(self, category_name: str, first_sticker: Path, button_size: int, parent=None):
         super().__init__(parent)
         self.category_name = category_name
@@ -326,77 +414,176 @@ class CategoryButton(QPushButton):
     def set_thumbnail(self, pixmap: QPixmap):
         """设置缩略图为按钮图标"""
         if pixmap:
-            scaled_pixmap = pixmap.scaled(
-                self.width() - 10,
-                self.height() - 10,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            self.setIcon(QIcon(scaled_pixmap))
-            self.setIconSize(QSize(self.width() - 10, self.height() - 10))
+            target = self.width() - 10
+            cache_key = f"{self.first_sticker}:{target}"
+
+            icon = self._icon_cache.get(cache_key)
+            if icon is None:
+                # 缓存中已是目标尺寸时直接使用，避免重复缩放
+                if pixmap.width() > target or pixmap.height() > target:
+                    # 缩小超过4倍时分两步：先快速缩到2倍目标，再平滑缩到位，
+                    # 大头像素削减走快速路径，只有最后一步做质量重采样
+                    if max(pixmap.width(), pixmap.height()) > 4 * target:
+                        pixmap = pixmap.scaled(
+                            target * 2,
+                            target * 2,
+                            Qt.KeepAspectRatio,
+                            Qt.FastTransformation
+                        )
+                    pixmap = pixmap.scaled(
+                        target,
+                        target,
+                        Qt.KeepAspectRatio,
+                        Qt.SmoothTransformation
+                    )
+                icon = QIcon(pixmap)
+                self._icon_cache[cache_key] = icon
+
+            self.setIcon(icon)
+            self.setIconSize(QSize(target, target))
 
 
 # ==================== 全局热键监听 ====================
-class HotkeyListener(QObject):
-    """全局热键监听器"""
+class HotkeyListener(QWidget):
+    """全局热键监听器
+
+    通过Windows的RegisterHotKey注册系统热键：内核负责过滤按键，
+    只把命中的组合以WM_HOTKEY消息投递到本隐藏窗口的消息循环。
+    相比keyboard库的全局低级钩子，不再为每次按键唤醒Python回调，
+    也省掉了后台监听线程。
+    """
 
     hotkey_pressed = Signal()
 
+    WM_HOTKEY = 0x0312
+    HOTKEY_ID = 1
+    MOD_NOREPEAT = 0x4000
+
+    # keyboard风格热键串里的修饰键 -> Win32修饰掩码
+    _MODIFIERS = {
+        'alt': 0x0001,    # MOD_ALT
+        'ctrl': 0x0002,   # MOD_CONTROL
+        'shift': 0x0004,  # MOD_SHIFT
+        'win': 0x0008,      # MOD_WIN
+        'windows': 0x0008,  # keyboard库写法的别名
+    }
+
+    # 常用具名主键 -> 虚拟键码（兼容keyboard风格的配置写法）
+    _NAMED_KEYS = {
+        'space': 0x20,
+        'enter': 0x0D,
+        'tab': 0x09,
+        'esc': 0x1B,
+        'escape': 0x1B,
+        'backspace': 0x08,
+        'insert': 0x2D,
+        'delete': 0x2E,
+        'home': 0x24,
+        'end': 0x23,
+        'pageup': 0x21,
+        'pagedown': 0x22,
+        'left': 0x25,
+        'up': 0x26,
+        'right': 0x27,
+        'down': 0x28,
+        **{f'f{i}': 0x6F + i for i in range(1, 13)},  # F1-F12
+    }
+
     def __init__(self, hotkey: str):
         super().__init__()
         self.hotkey = hotkey
         self.running = True
-        self.thread = None
+        self.registered = False
 
     def start(self):
-        """启动热键监听"""
+        """注册系统热键"""
+        import ctypes
+
         self.running = True
         try:
-            keyboard.add_hotkey(self.hotkey, self.on_hotkey)
-            logging.info(f"全局热键已注册: {self.hotkey}")
+            modifiers, vk = self._parse_hotkey(self.hotkey)
+            # winId()会按需创建原生窗口句柄，窗口本身保持隐藏
+            if ctypes.windll.user32.RegisterHotKey(
+                    int(self.winId()), self.HOTKEY_ID,
+                    modifiers | self.MOD_NOREPEAT, vk):
+                self.registered = True
+                logging.info(f"全局热键已注册: {self.hotkey}")
+            else:
+                self._notify_failure(f"热键 {self.hotkey} 注册失败，可能已被其他程序占用")
         except Exception as e:
-            logging.error(f"热键注册失败: {e}")
+            self._notify_failure(f"热键 {self.hotkey} 注册失败: {e}")
+
+    def _notify_failure(self, message: str):
+        """注册失败时记录日志，并尽量通过托盘气泡提醒用户"""
+        logging.error(message)
+
+        tray = get_existing_tray_icon()
+        if tray:
+            tray.showMessage(
+                "表情包管理器",
+                message,
+                icon=QSystemTrayIcon.MessageIcon.Warning,
+                msecs=3000,
+            )
 
     def stop(self):
-        """停止热键监听"""
+        """注销系统热键"""
+        import ctypes
+
         self.running = False
-        try:
-            keyboard.remove_hotkey(self.hotkey)
-        except:
-            pass
-        try:
-            keyboard.unhook_all()
-        except:
-            pass
+        if self.registered:
+            try:
+                ctypes.windll.user32.UnregisterHotKey(
+                    int(self.winId()), self.HOTKEY_ID
+                )
+            except Exception:
+                pass
+            self.registered = False
         logging.info("热键监听已停止")
 
-    def on_hotkey(self):
-        """热键触发"""
-        if self.running:
-            self.hotkey_pressed.emit()
+    def nativeEvent(self, eventType, message):
+        """拦截投递给本窗口的WM_HOTKEY消息"""
+        if eventType == b"windows_generic_MSG":
+            import ctypes.wintypes
+
+            msg = ctypes.wintypes.MSG.from_address(int(message))
+            if msg.message == self.WM_HOTKEY and msg.wParam == self.HOTKEY_ID:
+                if self.running:
+                    self.hotkey_pressed.emit()
+                return True, 0
+
+        return super().nativeEvent(eventType, message)
+
+    def _parse_hotkey(self, hotkey: str) -> Tuple[int, int]:
+        """把keyboard风格的'ctrl+shift+e'解析为(修饰掩码, 虚拟键码)"""
+        modifiers = 0
+        vk = None
+
+        for part in hotkey.lower().split('+'):
+            part = part.strip()
+            if part in self._MODIFIERS:
+                modifiers |= self._MODIFIERS[part]
+            elif part in self._NAMED_KEYS:
+                vk = self._NAMED_KEYS[part]
+            elif len(part) == 1:
+                # 字母和数字的虚拟键码等于其大写ASCII码
+                vk = ord(part.upper())
+            else:
+                raise ValueError(f"无法解析的热键: {hotkey}")
+
+        if vk is None:
+            raise ValueError(f"热键缺少主键: {hotkey}")
+
+        return modifiers, vk
 
 
 def get_existing_tray_icon() -> QSystemTrayIcon | None:
-    """遍历应用内所有对象，找到第一个QSystemTrayIcon实例"""
+    """获取托盘图标（由SystemTrayManager创建时挂到应用实例上）"""
     app = QApplication.instance()
     if not app:
         return None
 
-    # 递归查找 QSystemTrayIcon
-    def find_tray_in_children(parent) -> QSystemTrayIcon | None:
-        # 检查当前对象是否是 QSystemTrayIcon
-        if isinstance(parent, QSystemTrayIcon):
-            return parent
-
-        # 检查所有子对象
-        for child in parent.children():
-            result = find_tray_in_children(child)
-            if result:
-                return result
-        return None
-
-    # 从应用程序实例开始查找
-    return find_tray_in_children(app)
+    return getattr(app, 'tray_icon', None)
 
 
 # ==================== 主窗口 ====================
@@ -407,9 +594,27 @@ class StickerManagerWindow(QMainWindow):
         super().__init__()
         self.config = config
         self.library = None
-        self.thumbnail_cache = ThumbnailCache(config.get('performance.thumbnail_cache_size', 200))
         self.current_category = None
-        self.current_cells: List[StickerCell] = []
+
+        # 窗口生命周期内不变的配置，初始化时一次性取出，显示循环里不再逐项查表
+        self.cell_size = config.get('ui.grid_cell_size', 120)
+        self.button_size = config.get('ui.category_button_size', 80)
+        self.search_delay = config.get('behavior.search_delay_ms', 300)
+
+        # 缩略图解码在全局线程池中进行，GUI线程不再被解码阻塞；
+        # 按缓存键记录在途任务及其所有等待控件，同一张图只解码一次
+        self.thread_pool = QThreadPool.globalInstance()
+        self._pending_thumbs: Dict[str, List[QWidget]] = {}
+        # 解码失败的键：坏文件不再随每次重绘反复解码、反复刷日志
+        self._failed_thumbs: set = set()
+
+        # 双击复制用的原图小容量LRU，避免对刚解码过的图再做一次全量解码
+        self._fullres_lru: OrderedDict = OrderedDict()
+
+        # 使用Qt全局像素图缓存（原生内存、按字节淘汰、全应用共享），按每张约64KB估算上限
+        QPixmapCache.setCacheLimit(
+            config.get('performance.thumbnail_cache_size', 200) * 64
+        )
 
         self.init_ui()
         self.load_library()
@@ -442,6 +647,12 @@ class StickerManagerWindow(QMainWindow):
         right_panel = self.create_sticker_panel()
         main_layout.addWidget(right_panel, 3)
 
+        # 搜索防抖：单个复用的定时器，每次按键只需重新start
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.timeout.connect(self._run_search)
+        self._pending_query = ""
+
         # ESC键隐藏
         esc_shortcut = QShortcut(QKeySequence(Qt.Key_Escape), self)
         esc_shortcut.activated.connect(self.hide_window)
@@ -489,17 +700,20 @@ class StickerManagerWindow(QMainWindow):
         search_layout.addWidget(clear_btn)
         layout.addLayout(search_layout)
 
-        # 表情网格滚动区域
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-
-        self.grid_container = QWidget()
-        self.grid_layout = QGridLayout(self.grid_container)
-        self.grid_layout.setSpacing(8)
-        self.grid_layout.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-
-        scroll.setWidget(self.grid_container)
-        layout.addWidget(scroll)
+        # 虚拟化表情网格：视图只向模型请求可见项，分类大小不影响内存和首绘
+        self.sticker_model = StickerModel(self.model_thumbnail, self)
+        self.sticker_view = QListView()
+        self.sticker_view.setModel(self.sticker_model)
+        self.sticker_view.setViewMode(QListView.IconMode)
+        self.sticker_view.setResizeMode(QListView.Adjust)
+        self.sticker_view.setMovement(QListView.Static)
+        self.sticker_view.setUniformItemSizes(True)
+        self.sticker_view.setIconSize(QSize(self.cell_size - 10, self.cell_size - 10))
+        self.sticker_view.setGridSize(QSize(self.cell_size, self.cell_size))
+        self.sticker_view.setEditTriggers(QListView.NoEditTriggers)
+        self.sticker_view.doubleClicked.connect(self.on_sticker_double_clicked)
+
+        layout.addWidget(self.sticker_view)
 
         return panel
 
@@ -508,7 +722,9 @@ class StickerManagerWindow(QMainWindow):
         library_path = self.config.get('library_path', '')
 
         if not library_path or not Path(library_path).exists():
-            # 弹出选择目录对话框
+            # 弹出选择目录对话框（只有这条路径用到对话框，按需导入）
+            from PySide6.QtWidgets import QFileDialog
+
             library_path = QFileDialog.getExistingDirectory(
                 self,
                 "选择表情库目录",
@@ -529,41 +745,55 @@ class StickerManagerWindow(QMainWindow):
 
     def populate_categories(self):
         """填充分类列表"""
+        # 库刚（重新）加载，坏文件可能已被修复，给失败记录一次重试机会
+        self._failed_thumbs.clear()
+
         # 清空现有按钮
+        old_buttons = []
         while self.category_layout.count():
             item = self.category_layout.takeAt(0)
             if item.widget():
-                item.widget().deleteLater()
+                old_buttons.append(item.widget())
+        self._discard_pending_thumbs(old_buttons)
+        for btn in old_buttons:
+            btn.deleteLater()
 
         if not self.library or not self.library.categories:
             return
 
-        button_size = self.config.get('ui.category_button_size', 80)
+        button_size = self.button_size
 
-        for category_name, stickers in self.library.categories.items():
-            if not stickers:
-                continue
+        # 批量插入期间暂停重绘，整个面板只做一次布局和绘制
+        self.category_container.setUpdatesEnabled(False)
+        try:
+            for category_name, stickers in self.library.categories.items():
+                if not stickers:
+                    continue
 
-            first_sticker = stickers[0]
-            btn = CategoryButton(category_name, first_sticker, button_size)
-            btn.clicked.connect(lambda checked, cat=category_name: self.show_category(cat))
-            btn.setToolTip(category_name)
+                first_sticker = stickers[0]
+                btn = CategoryButton(category_name, first_sticker, button_size)
+                # 统一槽函数从sender取分类名，免去逐按钮构造闭包
+                btn.clicked.connect(self.on_category_clicked)
+                btn.setToolTip(category_name)
 
-            self.category_layout.addWidget(btn)
+                self.category_layout.addWidget(btn)
 
-            # 加载缩略图
-            self.load_thumbnail_for_button(btn, first_sticker)
+                # 加载缩略图
+                self.request_thumbnail(btn, first_sticker, button_size - 10)
+        finally:
+            self.category_container.setUpdatesEnabled(True)
+            self.category_container.update()
 
         # 默认显示第一个分类
-        if self.library.categories:
-            first_category = list(self.library.categories.keys())[0]
+        first_category = next(iter(self.library.categories), None)
+        if first_category:
             self.show_category(first_category)
 
-    def load_thumbnail_for_button(self, button: CategoryButton, image_path: Path):
-        """为分类按钮加载缩略图"""
-        pixmap = self.get_thumbnail(image_path, button.width() - 10)
-        if pixmap:
-            button.set_thumbnail(pixmap)
+    def on_category_clicked(self):
+        """分类按钮点击，切换到对应分类"""
+        btn = self.sender()
+        if btn is not None:
+            self.show_category(btn.category_name)
 
     def show_category(self, category_name: str):
         """显示指定分类的表情"""
@@ -576,88 +806,90 @@ class StickerManagerWindow(QMainWindow):
         logging.info(f"显示分类: {category_name}, 共 {len(stickers)} 个表情")
 
     def display_stickers(self, stickers: List[Path]):
-        """在网格中显示表情列表"""
-        # 清空现有单元格
-        for cell in self.current_cells:
-            cell.deleteLater()
-        self.current_cells.clear()
-
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        """在虚拟化视图中显示表情列表（预览图已在扫描阶段过滤）"""
+        self.sticker_model.set_stickers(stickers)
 
-        if not stickers:
-            return
+    def model_thumbnail(self, image_path: Path) -> Optional[QPixmap]:
+        """模型数据角色的缩略图查询：命中即返回，未命中调度异步加载"""
+        max_size = self.cell_size - 10
+        cache_key = f"{image_path}_{max_size}"
 
-        cell_size = self.config.get('ui.grid_cell_size', 120)
-        columns = self.config.get('ui.grid_columns', 3)
+        pixmap = QPixmap()
+        if QPixmapCache.find(cache_key, pixmap):
+            return pixmap
 
-        # 使用独立的计数器跟踪实际添加的单元格
-        idx = 0
+        # 已知的坏文件不再重试，避免每次重绘都触发一轮解码
+        if cache_key in self._failed_thumbs:
+            return None
+
+        self._submit_thumb_task(image_path, max_size, None)
+        return None
 
-        for _, sticker_path in enumerate(stickers):
-            # 跳过预览图
-            if os.path.basename(sticker_path).startswith(".preview"):
-                continue
+    def request_thumbnail(self, widget, image_path: Path, max_size: int):
+        """请求控件缩略图：缓存命中直接设置，否则提交后台解码任务"""
+        cache_key = f"{image_path}_{max_size}"
 
-            # 使用实际添加的单元格索引计算行列
-            row = idx // columns
-            col = idx % columns
+        pixmap = QPixmap()
+        if QPixmapCache.find(cache_key, pixmap):
+            widget.set_thumbnail(pixmap)
+            return
 
-            cell = StickerCell(sticker_path, cell_size)
-            cell.clicked.connect(self.on_sticker_clicked)
-            cell.double_clicked.connect(self.on_sticker_double_clicked)
-            cell.setToolTip(os.path.basename(sticker_path))
+        if cache_key in self._failed_thumbs:
+            return
 
-            self.grid_layout.addWidget(cell, row, col)
-            self.current_cells.append(cell)
+        self._submit_thumb_task(image_path, max_size, widget)
 
-            # 加载缩略图
-            self.load_thumbnail_for_cell(cell, sticker_path)
+    def _submit_thumb_task(self, image_path: Path, max_size: int, widget):
+        """提交后台解码任务；widget为None时结果交给表情模型刷新"""
+        cache_key = f"{image_path}_{max_size}"
 
-            # 递增实际单元格计数器
-            idx += 1
+        # 同一张图在途任务只提交一次（可见行重绘会反复触发data()），
+        # 后来的控件登记到投递名单，共享同一次解码结果
+        targets = self._pending_thumbs.get(cache_key)
+        if targets is not None:
+            if widget is not None:
+                targets.append(widget)
+            return
 
-    def load_thumbnail_for_cell(self, cell: StickerCell, image_path: Path):
-        """为表情单元格加载缩略图"""
-        pixmap = self.get_thumbnail(image_path, cell.cell_size - 10)
-        if pixmap:
-            cell.set_thumbnail(pixmap)
+        self._pending_thumbs[cache_key] = [widget] if widget is not None else []
+        task = ThumbTask(image_path, max_size)
+        task.signals.done.connect(self.on_thumbnail_ready)
+        self.thread_pool.start(task)
 
-    def get_thumbnail(self, image_path: Path, max_size: int) -> Optional[QPixmap]:
-        """获取缩略图（带缓存）"""
+    def on_thumbnail_ready(self, image_path: str, max_size: int, image: QImage):
+        """后台解码完成，回到GUI线程转换为QPixmap并分发"""
         cache_key = f"{image_path}_{max_size}"
+        targets = self._pending_thumbs.pop(cache_key, [])
 
-        # 尝试从缓存获取
-        cached = self.thumbnail_cache.get(cache_key)
-        if cached:
-            return cached
+        if image.isNull():
+            self._failed_thumbs.add(cache_key)
+            logging.warning(f"无法加载图片: {image_path}")
+            return
 
-        # 生成缩略图
-        try:
-            pixmap = QPixmap(str(image_path))
-            if pixmap.isNull():
-                logging.warning(f"无法加载图片: {image_path}")
-                return None
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(cache_key, pixmap)
 
-            # 缓存并返回
-            self.thumbnail_cache.put(cache_key, pixmap)
-            return pixmap
+        for widget in targets:
+            widget.set_thumbnail(pixmap)
 
-        except Exception as e:
-            logging.error(f"加载缩略图失败 {image_path}: {e}")
-            return None
+        # 模型侧按行刷新；路径不在当前列表时查不到行号，自然无操作
+        self.sticker_model.refresh_sticker(Path(image_path))
 
-    def on_sticker_clicked(self, sticker_path: Path):
-        """表情单击事件"""
-        # 清除其他单元格的高亮
-        for cell in self.current_cells:
-            if cell.sticker_path != sticker_path:
-                cell.clear_highlight()
+    def _discard_pending_thumbs(self, widgets):
+        """把即将销毁的控件从在途任务的投递名单中移除"""
+        doomed = set(widgets)
+        if doomed:
+            self._pending_thumbs = {
+                key: [w for w in targets if w not in doomed]
+                for key, targets in self._pending_thumbs.items()
+            }
 
-    def on_sticker_double_clicked(self, sticker_path: Path):
+    def on_sticker_double_clicked(self, index: QModelIndex):
         """表情双击事件 - 复制文件本体到剪贴板"""
+        sticker_path = self.sticker_model.sticker_at(index)
+        if sticker_path is None:
+            return
+
         _msg = f"已复制表情: {sticker_path.name}"
         _icon = QSystemTrayIcon.MessageIcon.Information
 
@@ -666,14 +898,24 @@ class StickerManagerWindow(QMainWindow):
             mime_data = QMimeData()
 
             # 添加文件 URL
-            from PySide6.QtCore import QUrl
-
             file_url = QUrl.fromLocalFile(str(sticker_path))
             mime_data.setUrls([file_url])
 
             # 同时添加文本格式的文件路径（作为备份）
             mime_data.setText(str(sticker_path))
 
+            # 附带图像数据：动图给原始文件字节（保留动画），静图给解码结果
+            suffix = sticker_path.suffix.lower()
+            if suffix in ('.gif', '.webp'):
+                mime_data.setData(
+                    f"image/{suffix[1:]}",
+                    QByteArray(sticker_path.read_bytes()),
+                )
+            else:
+                image = self.get_fullres_image(sticker_path)
+                if not image.isNull():
+                    mime_data.setImageData(image)
+
             # 获取剪贴板并设置 MIME 数据
             clipboard = QApplication.clipboard()
             clipboard.setMimeData(mime_data)
@@ -698,22 +940,42 @@ class StickerManagerWindow(QMainWindow):
                     msecs=1000,
                 )
 
+    def get_fullres_image(self, sticker_path: Path) -> QImage:
+        """取原图QImage（QImageReader解码，最多缓存8张的LRU）"""
+        key = str(sticker_path)
+
+        image = self._fullres_lru.get(key)
+        if image is not None:
+            self._fullres_lru.move_to_end(key)
+            return image
+
+        reader = QImageReader(key)
+        reader.setAutoTransform(True)
+        image = reader.read()
+
+        if not image.isNull():
+            self._fullres_lru[key] = image
+            if len(self._fullres_lru) > 8:
+                self._fullres_lru.popitem(last=False)
+
+        return image
+
     def on_search(self, text: str):
         """搜索事件"""
         if not text.strip():
+            self.search_timer.stop()
             # 恢复当前分类显示
             if self.current_category:
                 self.show_category(self.current_category)
             return
 
         # 延迟搜索
-        if hasattr(self, 'search_timer'):
-            self.search_timer.stop()
+        self._pending_query = text
+        self.search_timer.start(self.search_delay)
 
-        self.search_timer = QTimer()
-        self.search_timer.setSingleShot(True)
-        self.search_timer.timeout.connect(lambda: self.perform_search(text))
-        self.search_timer.start(self.config.get('behavior.search_delay_ms', 300))
+    def _run_search(self):
+        """防抖定时器到期，执行待处理的搜索"""
+        self.perform_search(self._pending_query)
 
     def perform_search(self, keyword: str):
         """执行搜索"""
@@ -756,8 +1018,9 @@ class SystemTrayManager(QObject):
         self.config = config
         self.hotkey_listener = hotkey_listener
 
-        # 创建托盘图标
+        # 创建托盘图标，并挂到应用实例上供get_existing_tray_icon直接取用
         self.tray_icon = QSystemTrayIcon(self.app)
+        self.app.tray_icon = self.tray_icon
 
         # 设置图标，增加错误处理
         try:
@@ -820,6 +1083,8 @@ class SystemTrayManager(QObject):
 
     def reload_library(self):
         """重新加载表情库"""
+        # 库内容可能已变化，作废按钮图标缓存
+        CategoryButton._icon_cache.clear()
         self.window.library.load_library()
         self.window.populate_categories()
         logging.info("表情库已重新加载")
@@ -865,12 +1130,12 @@ def main():
     # 连接热键信号
     hotkey_listener.hotkey_pressed.connect(lambda: window.show_window() if window.isHidden() else window.hide_window())
 
+    # 创建系统托盘（先于热键注册，注册失败时才能弹托盘提示）
+    tray = SystemTrayManager(app, window, config, hotkey_listener)
+
     # 启动热键监听
     hotkey_listener.start()
 
-    # 创建系统托盘
-    tray = SystemTrayManager(app, window, config, hotkey_listener)
-
     # 显示窗口
     # window.show_window()
 